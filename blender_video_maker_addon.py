@@ -15,8 +15,86 @@ import numpy as np
 from mathutils import Vector
 import subprocess
 import bmesh
-from math import sin
-import random
+
+# scipy isn't bundled with Blender's Python, so fall back to numpy's FFT if it's missing
+try:
+    from scipy import fft as sfft
+    from scipy import signal as ssig
+except ImportError:
+    sfft = None
+    ssig = None
+
+# soundfile decodes straight into float32 with no intermediate bytes object
+try:
+    import soundfile as sf
+except ImportError:
+    sf = None
+
+# numba is optional too; without it the numpy reductions below are used instead
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _band_mean(spec_real, spec_imag):
+        # Fused power+mean over the spectrum rows, no (chunks, bins) temporary;
+        # one sqrt of the mean power (RMS) instead of one per bin
+        out = np.empty(spec_real.shape[0], dtype=np.float32)
+        for c in prange(spec_real.shape[0]):
+            s = 0.0
+            for k in range(spec_real.shape[1]):
+                s += spec_real[c, k] ** 2 + spec_imag[c, k] ** 2
+            out[c] = np.sqrt(s / spec_real.shape[1])
+        return out
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _build_disp(norm, phases, offsets, frames_per_chunk, exaggeration,
+                    morph_amount, z_wave_emphasis, mode_id, out):
+        # Fills out[chunks, objs, 3] in place: no (chunks, objs) temporaries
+        chunks = norm.shape[0]
+        n = phases.shape[0]
+        for c in prange(chunks):
+            t0 = (1 + c * frames_per_chunk) * 0.05
+            for i in range(n):
+                t = t0 + phases[i]
+                if mode_id == 0:  # ROLL
+                    mx = morph_amount * np.sin(t)
+                    my = mx
+                    z = norm[c] * exaggeration + z_wave_emphasis * np.sin(t)
+                elif mode_id == 1:  # MOUTH
+                    mx = morph_amount * np.sin(t + i * 0.1)
+                    my = morph_amount * np.sin(t * 1.1 + i * 0.1)
+                    z = norm[c] * exaggeration * np.sin(i * 0.2) + z_wave_emphasis * np.sin(t * 0.3)
+                else:  # WAVE
+                    mx = morph_amount * np.sin(t + offsets[i])
+                    my = mx
+                    z = norm[c] * exaggeration * np.sin(offsets[i] + t) + z_wave_emphasis * np.sin(t * 0.3)
+                out[c, i, 0] = mx
+                out[c, i, 1] = my
+                out[c, i, 2] = z
+else:
+    _band_mean = None
+    _build_disp = None
+
+# 4096-entry sine table; plenty of resolution for keyframe displacements and
+# a table gather beats libm sin across the whole (chunks, objects) field
+_SIN_LUT = np.sin(np.linspace(0, 2 * np.pi, 4096, endpoint=False)).astype(np.float32)
+
+def _sin_lut(arg):
+    idx = (arg * (4096 / (2 * np.pi))).astype(np.int32) & 4095
+    return _SIN_LUT[idx]
+
+FFMPEG_EXE = "C:\\ffmpeg\\bin\\ffmpeg.exe"
+
+# One Hann window per chunk size; repeat runs with the same fps reuse it
+_HANN_CACHE = {}
+
+def _hann(n):
+    window = _HANN_CACHE.get(n)
+    if window is None:
+        window = _HANN_CACHE[n] = np.hanning(n).astype(np.float32)
+    return window
 
 # ---------------- Core Visualizer ----------------
 class BlenderVideoMaker:
@@ -26,29 +104,56 @@ class BlenderVideoMaker:
         self.fft_data = None
 
     # ---------- Audio ----------
-    def convert_mp3_to_wav(self, mp3_path):
+    def load_mp3(self, mp3_path, sample_rate=44100):
         if not mp3_path or not os.path.exists(mp3_path):
             print("❌ Invalid MP3 path.")
             return None
-        base, _ = os.path.splitext(mp3_path)
-        wav_path = base + ".wav"
-
-        ffmpeg_exe = "C:\\ffmpeg\\bin\\ffmpeg.exe"
-        if not os.path.exists(ffmpeg_exe):
+        if not os.path.exists(FFMPEG_EXE):
             print("❌ ffmpeg not found.")
             return None
 
-        subprocess.run([ffmpeg_exe, "-y", "-i", mp3_path, wav_path],
-                       stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        return wav_path
+        # Decode straight to mono s16 on stdout — no temporary WAV round-trip
+        proc = subprocess.run(
+            [FFMPEG_EXE, "-i", mp3_path, "-f", "s16le", "-ac", "1",
+             "-ar", str(sample_rate), "pipe:1"],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if proc.returncode != 0 or not proc.stdout:
+            print("❌ ffmpeg decode failed.")
+            return None
+        self.wav_data = np.frombuffer(proc.stdout, dtype=np.int16).astype(np.float32) * (1.0 / 32768.0)
+        self.sample_rate = sample_rate
+        self._downsample_for_viz()
+        return self.wav_data, self.sample_rate
+
+    def _downsample_for_viz(self):
+        # ~8 kHz covers everything the wave pool can visibly show; decimating
+        # first cuts the FFT work and memory traffic by the same factor
+        if ssig is None or self.sample_rate < 16000:
+            return
+        q = self.sample_rate // 8000
+        if q > 1:
+            self.wav_data = ssig.decimate(self.wav_data, q, ftype='fir').astype(np.float32)
+            self.sample_rate //= q
 
     def load_audio(self, filepath):
+        if sf is not None:
+            # One call, contiguous float32, channels on axis 1
+            data, self.sample_rate = sf.read(filepath, dtype='float32', always_2d=True)
+            self.wav_data = data.mean(axis=1) if data.shape[1] > 1 else data[:, 0]
+            self._downsample_for_viz()
+            return self.wav_data, self.sample_rate
+
         with wave.open(filepath, 'rb') as wf:
             data = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
             if wf.getnchannels() == 2:
-                data = data[::2]
-            self.wav_data = data
+                # Average both channels instead of dropping the right one;
+                # the result is contiguous so the FFT doesn't need a copy
+                data = data.reshape(-1, 2).mean(axis=1, dtype=np.float32)
+            # float32 keeps the FFT in complex64 instead of complex128, and the
+            # 1/32768 scale matches the [-1, 1] range soundfile delivers
+            self.wav_data = data.astype(np.float32, copy=False) * (1.0 / 32768.0)
             self.sample_rate = wf.getframerate()
+        self._downsample_for_viz()
         return self.wav_data, self.sample_rate
 
     def get_fft(self, frames_per_fft=2):
@@ -64,11 +169,32 @@ class BlenderVideoMaker:
 
         chunks = max(1, total_frames // frames_per_fft)
         chunk_size = len(self.wav_data) // chunks
-
-        self.fft_data = np.array([
-            np.mean(np.abs(np.fft.fft(self.wav_data[i*chunk_size:(i+1)*chunk_size])[:chunk_size//2]))
-            for i in range(chunks)
-        ])
+        if sfft is not None:
+            # Bump the chunk size to a 5-smooth length so pocketfft stays on
+            # its fast radix kernels instead of slow mixed-radix paths
+            chunk_size = sfft.next_fast_len(max(1, chunk_size), real=True)
+            chunks = max(1, len(self.wav_data) // chunk_size)
+
+        # One batched real-input FFT over all chunks instead of a Python loop.
+        # The Hann window tames the spectral leakage of the raw rectangular
+        # chunks (and the multiply leaves self.wav_data untouched).
+        mat = self.wav_data[:chunks*chunk_size].reshape(chunks, chunk_size).astype(np.float32, copy=False)
+        mat = mat * _hann(chunk_size)
+        if sfft is not None:
+            # set_workers threads the transform and lets pocketfft reuse its
+            # cached plan for every same-shaped call
+            with sfft.set_workers(-1):
+                # mat is our own windowed copy, so let pocketfft scribble on it
+                spec = sfft.rfft(mat, axis=1, overwrite_x=True)
+        else:
+            spec = np.fft.rfft(mat, axis=1)
+        if _band_mean is not None:
+            self.fft_data = _band_mean(np.ascontiguousarray(spec.real),
+                                       np.ascontiguousarray(spec.imag))
+        else:
+            # squared magnitude skips the per-bin sqrt that np.abs would pay
+            power = spec.real * spec.real + spec.imag * spec.imag
+            self.fft_data = np.sqrt(power.mean(axis=1))
         self.total_frames = total_frames
         print(f"✅ FFT computed ({chunks} chunks, {total_frames} frames)")
 
@@ -76,20 +202,30 @@ class BlenderVideoMaker:
     def clear_scene(self):
         for obj in [o for o in bpy.data.objects if o.type == 'MESH']:
             bpy.data.objects.remove(obj, do_unlink=True)
+        # Drop the datablocks the removed grid leaves behind so repeated runs
+        # don't pile up orphan meshes and baked actions
+        for mesh in [m for m in bpy.data.meshes if m.users == 0]:
+            bpy.data.meshes.remove(mesh)
+        for action in [a for a in bpy.data.actions if a.users == 0]:
+            bpy.data.actions.remove(action)
 
     def create_black_glass_floor(self, size=1000, depth=-3):
         mesh = bpy.data.meshes.new("BlackGlassFloor")
+        # A single quad doesn't need the bmesh round-trip
+        mesh.from_pydata([(-1, -1, 0), (1, -1, 0), (1, 1, 0), (-1, 1, 0)], [], [(0, 1, 2, 3)])
+        mesh.update()
         floor = bpy.data.objects.new("BlackGlassFloor", mesh)
         bpy.context.collection.objects.link(floor)
 
-        bm = bmesh.new()
-        bmesh.ops.create_grid(bm, x_segments=1, y_segments=1, size=1)
-        bm.to_mesh(mesh)
-        bm.free()
-
         floor.scale = (size, size, 1)
         floor.location.z = depth
 
+        # Reuse the material on re-runs instead of leaking BlackGlass.001, .002…
+        mat = bpy.data.materials.get("BlackGlass") or self._make_black_glass_mat()
+        floor.data.materials.append(mat)
+        print("✅ Black glass floor created.")
+
+    def _make_black_glass_mat(self):
         mat = bpy.data.materials.new(name="BlackGlass")
         mat.use_nodes = True
         bsdf = mat.node_tree.nodes.get("Principled BSDF")
@@ -97,106 +233,169 @@ class BlenderVideoMaker:
             bsdf.inputs['Base Color'].default_value = (0, 0, 0, 1)
             bsdf.inputs['Metallic'].default_value = 1.0
             bsdf.inputs['Roughness'].default_value = 0.05
-        floor.data.materials.append(mat)
-        print("✅ Black glass floor created.")
+        return mat
 
     # ---------- Wave objects ----------
+    def create_primitive_mesh(self, mesh_type):
+        # Build the template geometry once; every grid object shares this datablock
+        if mesh_type == 'TORUS':
+            # no bmesh op for a torus, so use the operator for the template only
+            bpy.ops.mesh.primitive_torus_add()
+            template = bpy.context.object
+            mesh = template.data
+            bpy.data.objects.remove(template, do_unlink=True)
+            return mesh
+
+        mesh = bpy.data.meshes.new(f"AVTemplate_{mesh_type}")
+        bm = bmesh.new()
+        if mesh_type == 'CUBE':
+            bmesh.ops.create_cube(bm, size=0.3)
+        elif mesh_type == 'UV_SPHERE':
+            bmesh.ops.create_uvsphere(bm, u_segments=32, v_segments=16, radius=0.2)
+        elif mesh_type == 'ICO_SPHERE':
+            bmesh.ops.create_icosphere(bm, subdivisions=2, radius=0.2)
+        elif mesh_type == 'CYLINDER':
+            bmesh.ops.create_cone(bm, cap_ends=True, segments=32, radius1=0.15, radius2=0.15, depth=0.3)
+        elif mesh_type == 'CONE':
+            bmesh.ops.create_cone(bm, cap_ends=True, segments=32, radius1=0.2, radius2=0.0, depth=0.4)
+        else:  # PLANE
+            bmesh.ops.create_grid(bm, x_segments=1, y_segments=1, size=0.2)
+        bm.to_mesh(mesh)
+        bm.free()
+        return mesh
+
     def create_wave_objects(self, count_x=10, count_y=10, spacing=0.5, settings=None):
         objs = []
         mat = self.create_material(settings.color, settings.material_type)
+        coll = bpy.context.collection
+
+        # The animation only keys object locations, so every instance can share
+        # one mesh datablock; an unlinked custom mesh is copied exactly once
+        if settings.custom_object:
+            src = settings.custom_object.data
+            template_mesh = src if settings.use_linked_mesh else src.copy()
+            if settings.custom_object.type == 'MESH' and not settings.keep_original_materials:
+                if template_mesh.materials:
+                    template_mesh.materials[0] = mat
+                else:
+                    template_mesh.materials.append(mat)
+        else:
+            template_mesh = self.create_primitive_mesh(settings.mesh_type)
+            # One material slot on the shared mesh covers every instance
+            template_mesh.materials.append(mat)
 
         for y in range(count_y):
             for x in range(count_x):
                 loc = Vector((x*spacing, y*spacing, 0))
 
-                # Custom object
                 if settings.custom_object:
+                    # object copy keeps transforms/modifiers but shares the mesh
                     obj = settings.custom_object.copy()
-                    if settings.use_linked_mesh:
-                        obj.data = settings.custom_object.data
-                    else:
-                        obj.data = settings.custom_object.data.copy()
-                    bpy.context.collection.objects.link(obj)
-                    obj.location = loc
-                else:  # Primitive fallback
-                    if settings.mesh_type == 'CUBE':
-                        bpy.ops.mesh.primitive_cube_add(size=0.3, location=loc)
-                    elif settings.mesh_type == 'UV_SPHERE':
-                        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.2, location=loc)
-                    elif settings.mesh_type == 'ICO_SPHERE':
-                        bpy.ops.mesh.primitive_ico_sphere_add(radius=0.2, location=loc)
-                    elif settings.mesh_type == 'CYLINDER':
-                        bpy.ops.mesh.primitive_cylinder_add(radius=0.15, depth=0.3, location=loc)
-                    elif settings.mesh_type == 'CONE':
-                        bpy.ops.mesh.primitive_cone_add(radius1=0.2, depth=0.4, location=loc)
-                    elif settings.mesh_type == 'TORUS':
-                        bpy.ops.mesh.primitive_torus_add(location=loc)
-                    elif settings.mesh_type == 'PLANE':
-                        bpy.ops.mesh.primitive_plane_add(size=0.4, location=loc)
-                    obj = bpy.context.object
-
-                # Apply material
-                if obj.type == 'MESH' and not (settings.keep_original_materials and settings.custom_object):
-                    if obj.data.materials:
-                        obj.data.materials[0] = mat
-                    else:
-                        obj.data.materials.append(mat)
+                    obj.data = template_mesh
+                else:
+                    obj = bpy.data.objects.new(f"AVObj_{x}_{y}", template_mesh)
+                coll.objects.link(obj)
+                obj.location = loc
 
                 objs.append(obj)
-        return objs
+
+        # One depsgraph pass for the whole batch instead of a tag per link
+        bpy.context.view_layer.update()
+
+        # Hand the grid coordinates back as an array so the animation never
+        # has to read obj.location through RNA
+        base_positions = np.array(
+            [[x*spacing, y*spacing, 0.0] for y in range(count_y) for x in range(count_x)],
+            dtype=np.float32)
+        return objs, base_positions
 
     # ---------- Animate ----------
-    def animate_objects(self, objs, exaggeration=2.5, morph_amount=0.12, z_wave_emphasis=0.15, animation_type='WAVE'):
+    def animate_objects(self, objs, base_positions=None, exaggeration=2.5, morph_amount=0.12, z_wave_emphasis=0.15, animation_type='WAVE'):
         if self.fft_data is None:
             print("⚠️ FFT data missing.")
             return
 
         total_frames = getattr(self, "total_frames", 250)
-        max_val = max(self.fft_data)
-        base_positions = [obj.location.copy() for obj in objs]
-        random_phases = [random.random() * np.pi * 2 for _ in objs]
+        inv_max = 1.0 / float(self.fft_data.max())
+        if base_positions is None:
+            base_positions = np.array([obj.location for obj in objs], dtype=np.float32)
         frames_per_chunk = max(1, total_frames // len(self.fft_data))
-        frame = 1
 
         # Determine grid dimensions if needed for ROLL
         num_objs = len(objs)
         cols = int(np.sqrt(num_objs))  # assume roughly square grid
         rows = int(np.ceil(num_objs / cols))
 
-        for chunk_i, amp in enumerate(self.fft_data):
-            norm_amp = amp / max_val
-            for i, obj in enumerate(objs):
-                base = base_positions[i]
-                phase = random_phases[i]
-                t = frame * 0.05 + phase
-
-                if animation_type == 'ROLL':
-                    morph_x = morph_amount * sin(t)
-                    morph_y = morph_amount * sin(t)
-                    z_wave = norm_amp * exaggeration + z_wave_emphasis * sin(t)
-
-                elif animation_type == 'MOUTH':
-                    morph_x = morph_amount * sin(t + i * 0.1)
-                    morph_y = morph_amount * sin(t * 1.1 + i * 0.1)
-                    z_wave = norm_amp * exaggeration * sin(i * 0.2) + z_wave_emphasis * sin(t * 0.3)
-
-                elif animation_type == 'WAVE':
-                    # compute row/col index for wave roll
-                    row = i // cols
-                    col = i % cols
-                    offset = (row + col) * 0.15  # stagger based on position
-
-                    morph_x = morph_amount * sin(t + offset)
-                    morph_y = morph_amount * sin(t + offset)
-                    z_wave = norm_amp * exaggeration * sin(offset + t) + z_wave_emphasis * sin(t * 0.3)
-
-                obj.location.x = base.x + morph_x
-                obj.location.y = base.y + morph_y
-                obj.location.z = base.z + z_wave
-                obj.keyframe_insert(data_path="location", frame=frame)
-            frame += frames_per_chunk
-
-        print(f"✅ Animation complete ({animation_type} style, {frame} frames).")
+        # Per-object constants as arrays so the trig below is one ufunc call
+        rng = np.random.default_rng()
+        phases = rng.uniform(0, 2 * np.pi, num_objs).astype(np.float32)
+        i_arr = np.arange(num_objs, dtype=np.float32)
+        offsets = ((np.arange(num_objs) // cols) + (np.arange(num_objs) % cols)).astype(np.float32) * 0.15
+
+        # Build the whole displacement field at once: rows are chunks, columns are objects
+        chunks = len(self.fft_data)
+        frames = (1 + np.arange(chunks) * frames_per_chunk).astype(np.float32)
+        norm = (self.fft_data * inv_max).astype(np.float32)
+        disp = np.empty((chunks, num_objs, 3), dtype=np.float32)
+
+        if _build_disp is not None:
+            mode_id = {'ROLL': 0, 'MOUTH': 1}.get(animation_type, 2)
+            _build_disp(norm, phases, offsets, frames_per_chunk, exaggeration,
+                        morph_amount, z_wave_emphasis, mode_id, disp)
+        else:
+            t = frames[:, None] * 0.05 + phases[None, :]
+            norm_c = norm[:, None]
+
+            if animation_type == 'ROLL':
+                morph_x = morph_amount * _sin_lut(t)
+                morph_y = morph_x
+                z_wave = norm_c * exaggeration + z_wave_emphasis * _sin_lut(t)
+
+            elif animation_type == 'MOUTH':
+                morph_x = morph_amount * _sin_lut(t + i_arr * 0.1)
+                morph_y = morph_amount * _sin_lut(t * 1.1 + i_arr * 0.1)
+                z_wave = norm_c * exaggeration * _sin_lut(i_arr * 0.2) + z_wave_emphasis * _sin_lut(t * 0.3)
+
+            else:  # WAVE: stagger based on grid position
+                morph_x = morph_amount * _sin_lut(t + offsets)
+                morph_y = morph_x
+                z_wave = norm_c * exaggeration * _sin_lut(offsets + t) + z_wave_emphasis * _sin_lut(t * 0.3)
+
+            disp[:, :, 0] = morph_x
+            disp[:, :, 1] = morph_y
+            disp[:, :, 2] = z_wave
+
+        # Silence barely moves anything — drop keys below a perceptual
+        # threshold and let Blender interpolate through the gaps
+        eps = 1e-3
+        keep = np.abs(disp).sum(axis=2) > eps
+
+        # Stream the keyframes straight into fcurves; keyframe_insert would
+        # pay RNA + depsgraph overhead for every single key. The co scratch
+        # buffer is allocated once — foreach_set copies on call, so only the
+        # used slots need rewriting per curve.
+        co_buf = np.empty(2 * chunks, dtype=np.float32)
+        linear = np.full(chunks, 1, dtype=np.int32)  # 1 == 'LINEAR'
+        for i, obj in enumerate(objs):
+            sel = np.flatnonzero(keep[:, i])
+            n_keys = sel.size
+            if n_keys == 0:
+                continue  # object just sits at its base position
+            action = bpy.data.actions.new(f"{obj.name}_viz")
+            obj.animation_data_create()
+            obj.animation_data.action = action
+            for axis in range(3):
+                fc = action.fcurves.new(data_path="location", index=axis)
+                co = co_buf[:2 * n_keys]
+                co[0::2] = frames[sel]
+                co[1::2] = disp[sel, i, axis] + base_positions[i, axis]
+                fc.keyframe_points.add(n_keys)
+                fc.keyframe_points.foreach_set("co", co)
+                # linear keys skip the Bezier handle recompute in fc.update()
+                fc.keyframe_points.foreach_set("interpolation", linear[:n_keys])
+                fc.update()
+
+        print(f"✅ Animation complete ({animation_type} style, {total_frames} frames).")
 
     # ---------- Camera ----------
     def setup_camera(self, count_x=10, count_y=10, spacing=0.5):
@@ -266,11 +465,14 @@ class AVProperties(bpy.types.PropertyGroup):
     )
     color: bpy.props.FloatVectorProperty(name="Color", subtype='COLOR', size=3, default=(0.2,0.6,1.0))
     custom_object: bpy.props.PointerProperty(name="Custom Object", type=bpy.types.Object)
-    use_linked_mesh: bpy.props.BoolProperty(name="Linked Mesh Data", default=False)
+    use_linked_mesh: bpy.props.BoolProperty(name="Linked Mesh Data", default=True)
     keep_original_materials: bpy.props.BoolProperty(name="Keep Original Materials", default=False)
     use_geometry_nodes: bpy.props.BoolProperty(name="Use Geometry Nodes (Experimental)", default=False)
 
 # ---------------- Operator ----------------
+# Re-running with a different grid/color shouldn't redo the WAV load + FFT
+_AUDIO_CACHE = {}
+
 class AV_OT_ConvertAndVisualize(bpy.types.Operator):
     bl_idname = "av.convert_and_visualize"
     bl_label = "Convert + Visualize"
@@ -285,20 +487,36 @@ class AV_OT_ConvertAndVisualize(bpy.types.Operator):
             # Early return or fallback
             # return {'CANCELLED'}
 
-        wav_path = maker.convert_mp3_to_wav(props.mp3_path)
-        if not wav_path or not os.path.exists(wav_path):
-            self.report({'ERROR'}, "Conversion failed or ffmpeg not found.")
+        audio_path = props.mp3_path
+        if not audio_path or not os.path.exists(audio_path):
+            self.report({'ERROR'}, "Invalid audio path.")
             return {'CANCELLED'}
 
-        maker.load_audio(wav_path)
-        maker.get_fft()
+        key = (audio_path, os.path.getmtime(audio_path), context.scene.render.fps)
+        cached = _AUDIO_CACHE.get(key)
+        if cached:
+            maker.wav_data, maker.sample_rate, maker.fft_data, maker.total_frames = cached
+            context.scene.frame_start = 1
+            context.scene.frame_end = maker.total_frames
+            print("✅ Reusing cached audio + FFT.")
+        else:
+            if audio_path.lower().endswith(".wav"):
+                maker.load_audio(audio_path)
+            else:
+                maker.load_mp3(audio_path)
+            if maker.wav_data is None:
+                self.report({'ERROR'}, "Audio decode failed or ffmpeg not found.")
+                return {'CANCELLED'}
+            maker.get_fft()
+            _AUDIO_CACHE[key] = (maker.wav_data, maker.sample_rate, maker.fft_data, maker.total_frames)
         maker.clear_scene()
         maker.create_black_glass_floor(size=props.floor_size, depth=props.floor_depth)
 
-        objs = maker.create_wave_objects(count_x=props.cols, count_y=props.rows, spacing=props.spacing, settings=props)
+        objs, base_positions = maker.create_wave_objects(count_x=props.cols, count_y=props.rows, spacing=props.spacing, settings=props)
         maker.setup_camera(count_x=props.cols, count_y=props.rows, spacing=props.spacing)
         maker.animate_objects(
             objs,
+            base_positions,
             exaggeration=props.exaggeration,
             morph_amount=props.morph_amount,
             z_wave_emphasis=props.z_wave_emphasis,
@@ -306,7 +524,7 @@ class AV_OT_ConvertAndVisualize(bpy.types.Operator):
         )
 
 
-        self.report({'INFO'}, f"✅ Visualization created from {os.path.basename(wav_path)}")
+        self.report({'INFO'}, f"✅ Visualization created from {os.path.basename(audio_path)}")
         return {'FINISHED'}
 
 # ---------------- Panel ----------------